@@ -1,6 +1,7 @@
 import streamlit as st
 import sys
 import os
+from pathlib import Path
 
 # Page configuration
 st.set_page_config(
@@ -10,97 +11,23 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# --- Custom CSS for a beautiful, modern theme ---
-st.markdown(
-    """
-<style>
-    /* App background - soft cream */
-    .stApp {
-        background-color: #fffaf0;  /* Floral White */
-        color: #333333;
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    }
-
-    /* Main header with a rich maroon-gold gradient */
-    .main-header {
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(135deg, #800000, #B22222); /* DarkRed to FireBrick */
-        color: #FFD700; /* Gold text */
-        border-radius: 15px;
-        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.25);
-        margin-bottom: 2rem;
-        font-family: 'Georgia', serif;
-    }
-
-    /* Feature Cards - white with golden icon & subtle shadow */
-    .feature-card {
-        background: #fff;
-        border-radius: 15px;
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.1);
-        padding: 1.2rem;
-        text-align: center;
-        transition: transform 0.2s, box-shadow 0.2s;
-        cursor: pointer;
-    }
-    .feature-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 10px 20px rgba(0, 0, 0, 0.15);
-    }
-    .feature-icon {
-        font-size: 2rem;
-        margin-bottom: 0.5rem;
-        color: #FFD700; /* Gold accent */
-    }
+# --- Custom CSS theme ---
+# The theme lives in assets/theme.css so the multi-KB string is not baked
+# into this module; it is read and parsed once per process.
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    return (Path(__file__).parent / "assets" / "theme.css").read_text()
 
-    /* Metric Cards - white with gold metric */
-    .metric-card {
-        background: #fff;
-        border-radius: 12px;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        padding: 1rem;
-        text-align: center;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 16px rgba(0,0,0,0.15);
-    }
-    .metric-value {
-        font-size: 1.8rem;
-        font-weight: bold;
-        color: #B8860B; /* Dark Goldenrod */
-    }
-    .metric-label {
-        color: #7f8c8d;
-        font-size: 0.9rem;
-    }
 
-    /* Buttons styling - maroon to red gradient with gold text */
-    div.stButton > button {
-        background: linear-gradient(135deg, #B22222, #800000); /* FireBrick to DarkRed */
-        color: #FFD700; /* Gold text */
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 1.5rem;
-        font-weight: bold;
-        transition: background 0.3s, transform 0.2s;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    div.stButton > button:hover {
-        background: linear-gradient(135deg, #800000, #B22222); /* reverse gradient on hover */
-        transform: translateY(-2px);
-        color: #FFF8DC; /* lighter gold on hover */
-    }
+def inject_css():
+    """
+    Emit the theme <style> block. This must run on EVERY rerun: Streamlit
+    drops elements that are not re-emitted, so a once-per-session guard
+    would lose the styling on the first interaction. The expensive part
+    (reading the file) is cached in _load_css.
+    """
+    st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
-    /* Sidebar styling - match app background */
-    .css-1d391kg {
-        background-color: #fffaf0;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
 
 # Add current directory to path so local modules can be imported if needed
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -117,33 +44,23 @@ def show_home():
     )
 
     # Feature cards section
+    # All 4 cards are concatenated and emitted through ONE st.markdown call —
+    # each call runs the full markdown/HTML pipeline, so batching renders once.
     st.subheader("✨ Explore the Dashboard's Key Features")
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown(
-            '<div class="feature-card"><div class="feature-icon">⚡</div>'
-            '<h4>Live Matches</h4><p>Real-time scores, updates, and match details.</p></div>',
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            '<div class="feature-card"><div class="feature-icon">📊</div>'
-            '<h4>Top Stats</h4><p>Leaderboards for top batsmen and bowlers.</p></div>',
-            unsafe_allow_html=True,
-        )
-    with col3:
-        st.markdown(
-            '<div class="feature-card"><div class="feature-icon">🔍</div>'
-            '<h4>SQL Analytics</h4><p>Run advanced SQL queries for deep insights.</p></div>',
-            unsafe_allow_html=True,
-        )
-    with col4:
-        st.markdown(
-            '<div class="feature-card"><div class="feature-icon">🛠️</div>'
-            '<h4>CRUD Operations</h4><p>Add, update, and manage your own cricket data.</p></div>',
-            unsafe_allow_html=True,
-        )
+    feature_cards = [
+        '<div class="feature-card"><div class="feature-icon">⚡</div>'
+        '<h4>Live Matches</h4><p>Real-time scores, updates, and match details.</p></div>',
+        '<div class="feature-card"><div class="feature-icon">📊</div>'
+        '<h4>Top Stats</h4><p>Leaderboards for top batsmen and bowlers.</p></div>',
+        '<div class="feature-card"><div class="feature-icon">🔍</div>'
+        '<h4>SQL Analytics</h4><p>Run advanced SQL queries for deep insights.</p></div>',
+        '<div class="feature-card"><div class="feature-icon">🛠️</div>'
+        '<h4>CRUD Operations</h4><p>Add, update, and manage your own cricket data.</p></div>',
+    ]
+    st.markdown(
+        '<div class="card-grid">' + "".join(feature_cards) + "</div>",
+        unsafe_allow_html=True,
+    )
 
     st.markdown("---")
 
@@ -220,33 +137,22 @@ cricbuzz_livestats/
 
     st.markdown("---")
 
-    # Project Statistics
+    # Project Statistics – same single-markdown batching as the feature cards
     st.subheader("📊 Project Statistics")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.markdown(
-            '<div class="metric-card"><div class="metric-value">12</div>'
-            '<div class="metric-label">📁 Total Project Files</div></div>',
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            '<div class="metric-card"><div class="metric-value">7</div>'
-            '<div class="metric-label">🐍 Python Libraries Used</div></div>',
-            unsafe_allow_html=True,
-        )
-    with col3:
-        st.markdown(
-            '<div class="metric-card"><div class="metric-value">25</div>'
-            '<div class="metric-label">🔍 Planned SQL Analytics Queries</div></div>',
-            unsafe_allow_html=True,
-        )
-    with col4:
-        st.markdown(
-            '<div class="metric-card"><div class="metric-value">14</div>'
-            '<div class="metric-label">🗄️ Database Tables (Target)</div></div>',
-            unsafe_allow_html=True,
-        )
+    metric_cards = [
+        '<div class="metric-card"><div class="metric-value">12</div>'
+        '<div class="metric-label">📁 Total Project Files</div></div>',
+        '<div class="metric-card"><div class="metric-value">7</div>'
+        '<div class="metric-label">🐍 Python Libraries Used</div></div>',
+        '<div class="metric-card"><div class="metric-value">25</div>'
+        '<div class="metric-label">🔍 Planned SQL Analytics Queries</div></div>',
+        '<div class="metric-card"><div class="metric-value">14</div>'
+        '<div class="metric-label">🗄️ Database Tables (Target)</div></div>',
+    ]
+    st.markdown(
+        '<div class="card-grid">' + "".join(metric_cards) + "</div>",
+        unsafe_allow_html=True,
+    )
 
     st.markdown("---")
 
@@ -269,6 +175,8 @@ Use the page tabs (top) to explore:
     )
 
 def main():
+    inject_css()
+
     # Simple sidebar branding only – no extra navigation
     with st.sidebar:
         st.markdown("### 🏏 Cricbuzz LiveStats")
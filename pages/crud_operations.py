@@ -2,12 +2,10 @@
 
 import os
 import streamlit as st
-from dotenv import load_dotenv
 
 from utils.db_connection import (
     get_mysql_schema,
-    fetch_table,
-    get_table_columns,
+    get_table_bundle,
     run_select,
     insert_row,
     delete_rows,
@@ -17,11 +15,33 @@ from utils.db_connection import (
 # ---------------------------------
 # Load DB credentials from .env
 # ---------------------------------
-load_dotenv()
+@st.cache_resource(show_spinner=False)
+def _env():
+    """Parse .env once per process instead of on every module reload."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return (
+        os.getenv("DB_HOST", "127.0.0.1"),
+        os.getenv("DB_USER", "root"),
+        os.getenv("DB_PASSWORD", ""),
+    )
+
+
+DB_HOST, DB_USER, DB_PASSWORD = _env()
 
-DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
-DB_USER = os.getenv("DB_USER", "root")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "")
+
+# ---------------------------------
+# Cached table lookups
+# ---------------------------------
+# Every widget interaction re-runs this whole script, so without caching each
+# keystroke in a form would hit MySQL again. The password is
+# underscore-prefixed so Streamlit leaves it out of the cache key.
+# (Schema discovery is cached inside get_mysql_schema itself.)
+@st.cache_data(ttl=60, show_spinner=False)
+def _table_bundle(host, user, _passwd, database, table, limit, offset=0):
+    """Columns + one page of rows in one MySQL round-trip."""
+    return get_table_bundle(host, user, _passwd, database, table, limit, offset)
 
 
 def _ensure_schema_state():
@@ -60,10 +80,28 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
         st.error("❌ DB_HOST / DB_USER not set in `.env`. Please configure them.")
         return
 
-    if st.button("Connect & Discover Databases"):
+    connect_col, refresh_col = st.columns(2)
+    with refresh_col:
+        if st.button("🔄 Refresh Schema"):
+            # Drop the 5-minute cached discovery (e.g. after a CREATE TABLE
+            # from another client) so the next connect re-scans MySQL.
+            get_mysql_schema.clear()
+            st.session_state["schema"] = None
+            st.info("Schema cache cleared — connect again to re-discover.")
+
+    with connect_col:
+        connect_clicked = st.button("Connect & Discover Databases")
+
+    if connect_clicked:
         try:
             schema = get_mysql_schema(DB_HOST, DB_USER, DB_PASSWORD)
             st.session_state["schema"] = schema
+            # Sort once at connect time; every later rerun reuses these
+            # lists instead of re-sorting per widget interaction.
+            st.session_state["db_names"] = sorted(schema.keys())
+            st.session_state["table_names"] = {
+                db: sorted(info["tables"].keys()) for db, info in schema.items()
+            }
             st.success(f"✅ Connected. Found {len(schema)} database(s).")
         except Exception as e:
             st.error(f"❌ Failed to connect / discover schema: {e}")
@@ -81,7 +119,7 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
 
     st.header("📂 Select Database & Table")
 
-    dbs = sorted(schema.keys())
+    dbs = st.session_state.get("db_names") or sorted(schema.keys())
     if not dbs:
         st.warning("No user databases found.")
         return
@@ -93,7 +131,9 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
         index=max(0, dbs.index(default_db)),
     )
 
-    tables = sorted(schema[database]["tables"].keys()) if database else []
+    tables = st.session_state.get("table_names", {}).get(database) or (
+        sorted(schema[database]["tables"].keys()) if database else []
+    )
     if not tables:
         st.warning("No tables found in this database.")
         return
@@ -113,33 +153,42 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
     ]
 
     default_table = next((t for t in priority_tables if t in tables), tables[0])
-    table = st.selectbox(
-        "Choose Table",
-        tables,
-        index=max(0, tables.index(default_table)),
-    )
-
-    st.divider()
 
     # -------------------------------
     # 3) View / Read Table
     # -------------------------------
     st.subheader("📖 View Table Data")
 
-    limit = st.number_input(
-        "Rows to load",
-        min_value=1,
-        max_value=10_000,
-        value=200,
-        step=50,
-    )
+    # Table choice + row limit live in a form, so tweaking them does NOT
+    # rerun the whole script per click — everything lands in one rerun on
+    # submit. (The database selectbox stays outside because the table list
+    # depends on it.)
+    with st.form("view_form"):
+        table = st.selectbox(
+            "Choose Table",
+            tables,
+            index=max(0, tables.index(default_table)),
+        )
+
+        # Page-based reads: only one page ever crosses the wire / websocket,
+        # instead of up to 10,000 rows at once.
+        limit = st.selectbox("Page size", (50, 100, 200, 500), index=2)
+        page = st.number_input("Page", min_value=1, value=1, step=1)
 
-    if st.button("📥 Load Data"):
+        load_ok = st.form_submit_button("📥 Load Data")
+
+    if load_ok:
         try:
-            df, sql = fetch_table(DB_HOST, DB_USER, DB_PASSWORD, database, table, int(limit))
+            offset = (int(page) - 1) * int(limit)
+            _, df, sql = _table_bundle(
+                DB_HOST, DB_USER, DB_PASSWORD, database, table, int(limit), offset
+            )
             st.code(sql, language="sql")
             st.dataframe(df, width="stretch")
-            st.session_state["last_df"] = df
+            # Keep only a bounded preview (plus the SQL to re-run it) in the
+            # session, so long sessions across many tables don't pin RAM.
+            st.session_state["last_df"] = df.head(500).copy()
+            st.session_state["last_df_sql"] = sql
         except Exception as e:
             st.error(f"❌ Read failed: {e}")
 
@@ -175,7 +224,11 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
     st.subheader("➕ Insert Row")
 
     try:
-        cols_meta = get_table_columns(DB_HOST, DB_USER, DB_PASSWORD, database, table)
+        # Shares the cached bundle with the view section above, so column
+        # metadata never costs a second round-trip.
+        cols_meta, _, _ = _table_bundle(
+            DB_HOST, DB_USER, DB_PASSWORD, database, table, int(limit)
+        )
     except Exception as e:
         st.error(f"Failed to fetch column metadata: {e}")
         cols_meta = []
@@ -189,7 +242,7 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
 
             for col in cols_meta:
                 name = col["name"]
-                dtype = col["type"]
+                dtype = (col["type"] or "").lower()
                 extra = (col.get("extra") or "").lower()
 
                 # Skip auto-increment columns
@@ -197,8 +250,21 @@ You can change these by editing `.env` (DB_HOST, DB_USER, DB_PASSWORD).
                     st.text_input(f"{name} ({dtype}) [auto]", value="", disabled=True)
                     continue
 
-                val = st.text_input(f"{name} ({dtype})", value="")
-                inputs[name] = None if val.strip() == "" else val
+                # Dispatch on the MySQL type so numeric/date columns get
+                # typed widgets — values arrive natively typed, no
+                # string parsing on submit.
+                label = f"{name} ({dtype})"
+                if dtype in ("tinyint", "smallint", "mediumint", "int", "bigint"):
+                    val = st.number_input(label, value=None, step=1, format="%d")
+                elif dtype in ("float", "double", "decimal"):
+                    val = st.number_input(label, value=None)
+                elif dtype == "date":
+                    val = st.date_input(label, value=None)
+                else:
+                    raw = st.text_input(label, value="")
+                    val = None if raw.strip() == "" else raw
+
+                inputs[name] = val
 
             submitted = st.form_submit_button("✅ Insert Row")
             if submitted:
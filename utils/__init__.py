@@ -4,8 +4,10 @@ from .db_connection import (
     list_tables,
     get_table_columns,
     fetch_table,
+    get_table_bundle,
     run_select,
     insert_row,
+    insert_rows,
     delete_rows,
     execute_update,
 )
@@ -16,8 +18,10 @@ __all__ = [
     "list_tables",
     "get_table_columns",
     "fetch_table",
+    "get_table_bundle",
     "run_select",
     "insert_row",
+    "insert_rows",
     "delete_rows",
     "execute_update",
 ]
@@ -5,25 +5,54 @@ from typing import Any, Dict, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env (if present)
 load_dotenv()
 
 BASE_URL = "https://cricbuzz-cricket.p.rapidapi.com"
 
+# Shared keep-alive session: every call targets the same RapidAPI host, so
+# reusing the established TLS socket avoids a fresh TCP + TLS handshake per
+# call. Transient 429/5xx responses are retried with backoff by urllib3
+# before we ever see them.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
 
 class CricbuzzAPIError(RuntimeError):
     """Custom exception for Cricbuzz API errors."""
     pass
 
 
+# Memoized on first successful build; the env never changes mid-process,
+# so re-reading os.getenv on every request is wasted work in the hot path.
+_HEADERS: Optional[Dict[str, str]] = None
+
+
 def _get_headers() -> Dict[str, str]:
     """
-    Build RapidAPI headers from environment variables.
+    Build RapidAPI headers from environment variables (once).
     Expects:
       RAPIDAPI_KEY
       RAPIDAPI_HOST
     """
+    global _HEADERS
+    if _HEADERS is not None:
+        return _HEADERS
+
     api_key = os.getenv("RAPIDAPI_KEY")
     api_host = os.getenv("RAPIDAPI_HOST", "cricbuzz-cricket.p.rapidapi.com")
 
@@ -35,10 +64,11 @@ def _get_headers() -> Dict[str, str]:
             "RAPIDAPI_HOST=cricbuzz-cricket.p.rapidapi.com"
         )
 
-    return {
+    _HEADERS = {
         "x-rapidapi-key": api_key,
         "x-rapidapi-host": api_host,
     }
+    return _HEADERS
 
 
 def _request(
@@ -59,7 +89,7 @@ def _request(
     headers = _get_headers()
 
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=timeout)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=timeout)
     except requests.exceptions.RequestException as e:
         raise CricbuzzAPIError(f"Network error calling Cricbuzz API: {e}") from e
 
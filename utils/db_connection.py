@@ -1,103 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from urllib.parse import quote_plus
+
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.pooling import MySQLConnectionPool
 import pandas as pd
+import streamlit as st
+from sqlalchemy import create_engine, text
 
 
 # --------------------------------------------------
-# 1️⃣ Create Connection
+# 1️⃣ Create Connection (pooled)
 # --------------------------------------------------
-def create_connection(host, user, passwd, database=None):
+@st.cache_resource(show_spinner=False)
+def _get_pool(host, user, _passwd, database=None):
     """
-    Create a new MySQL connection.
-    NOT cached — Streamlit reruns may occur often.
+    One MySQLConnectionPool per (host, user, database), kept alive across
+    Streamlit reruns via cache_resource. Avoids paying the TCP + auth
+    handshake (~10-50 ms) on every helper call.
+
+    The password is underscore-prefixed so Streamlit never hashes it into
+    the cache key (same convention as the page-level caches).
     """
-    return mysql.connector.connect(
+    pool_name = f"cbz_{host}_{database or 'nodb'}"[:64]
+    return MySQLConnectionPool(
+        pool_name=pool_name,
+        pool_size=5,
         host=host,
         user=user,
-        password=passwd,
+        password=_passwd,
         database=database,
         autocommit=True,
     )
 
 
+def create_connection(host, user, passwd, database=None):
+    """
+    Borrow a connection from the cached pool.
+    Calling .close() on it returns it to the pool, so the existing
+    helpers below need no changes.
+    """
+    return _get_pool(host, user, passwd, database).get_connection()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_engine(host, user, _passwd, database):
+    """
+    Cached SQLAlchemy engine for the pandas read paths. pandas 2.x takes a
+    slow row-by-row fallback (and warns) for raw DB-API connections;
+    handing read_sql a real SQLAlchemy connectable enables its fast path.
+    The engine keeps its own small pool alongside the cursor-level one.
+    """
+    return create_engine(
+        f"mysql+mysqlconnector://{quote_plus(user)}:{quote_plus(_passwd)}"
+        f"@{host}/{database}",
+        pool_size=5,
+        pool_pre_ping=True,
+    )
+
+
 # --------------------------------------------------
 # 2️⃣ Discover Full Schema (DB → Tables → Columns)
 # --------------------------------------------------
-def get_mysql_schema(host, user, passwd):
+@st.cache_data(ttl=300, show_spinner=False)
+def get_mysql_schema(host, user, _passwd):
     """
     Returns nested dict with DBs → tables → column metadata.
     System DBs excluded.
+
+    Cached for 5 minutes: list_databases / list_tables / get_table_columns
+    all funnel through here, so one rerun populating a couple of dropdowns
+    would otherwise re-scan every database several times. Call
+    get_mysql_schema.clear() to force a re-discovery (the CRUD page
+    exposes a Refresh Schema button for this).
     """
+    passwd = _passwd
     conn = create_connection(host, user, passwd)
     cursor = conn.cursor()
     cursor.execute("SHOW DATABASES")
     all_databases = [db[0] for db in cursor]
+    cursor.close()
+    conn.close()
 
     excluded = {"information_schema", "performance_schema", "mysql", "sys"}
-    full_schema = {}
-
-    for db_name in all_databases:
-        if db_name in excluded:
-            continue
+    db_names = [d for d in all_databases if d not in excluded]
+    if not db_names:
+        return {}
 
-        try:
-            db_conn = create_connection(host, user, passwd, db_name)
-            db_cur = db_conn.cursor()
+    # Each database scan is independent, so fan them out over worker
+    # threads, each borrowing its own pooled connection: wall time is the
+    # slowest scan instead of the sum. Workers stay below pool_size (5)
+    # so the scan can never exhaust the pool.
+    with ThreadPoolExecutor(max_workers=min(4, len(db_names))) as ex:
+        results = ex.map(lambda d: _scan_db(host, user, passwd, d), db_names)
 
-            # Only real tables (skip views)
-            db_cur.execute("SHOW FULL TABLES WHERE Table_type = 'BASE TABLE'")
-            tables = db_cur.fetchall()
-            if not tables:
-                continue
+    return {name: info for name, info in zip(db_names, results) if info}
 
-            db_info = {
-                "tables": {},
-                "views": {},
-                "functions": {},
-                "procedures": {},
-            }
 
-            # Table columns
-            for table_row in tables:
-                table_name = table_row[0]
-                col_sql = """
-                    SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY,
-                           COLUMN_DEFAULT, EXTRA
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    ORDER BY ORDINAL_POSITION
-                """
-                db_cur.execute(col_sql, (db_name, table_name))
-                cols = db_cur.fetchall()
-
-                db_info["tables"][table_name] = [
-                    {
-                        "name": c[0],
-                        "type": c[1],
-                        "nullable": c[2],
-                        "key": c[3],
-                        "default": c[4],
-                        "extra": c[5],
-                    }
-                    for c in cols
-                ]
-
-            # Views
-            db_cur.execute("SHOW FULL TABLES WHERE Table_type = 'VIEW'")
-            for v in db_cur.fetchall():
-                db_info["views"][v[0]] = {}
-
-            db_cur.close()
-            db_conn.close()
-
-            full_schema[db_name] = db_info
-
-        except Error:
-            continue
-
-    cursor.close()
-    conn.close()
-    return full_schema
+def _scan_db(host, user, passwd, db_name):
+    """
+    Scan one database on its own pooled connection.
+    Returns the db_info dict, or None when the DB is empty / unreadable.
+    """
+    try:
+        conn = create_connection(host, user, passwd)
+    except Error:
+        return None
+
+    try:
+        cursor = conn.cursor()
+        safe_db = db_name.replace("`", "``")
+
+        # Only real tables (skip views)
+        cursor.execute(
+            f"SHOW FULL TABLES FROM `{safe_db}` WHERE Table_type = 'BASE TABLE'"
+        )
+        tables = cursor.fetchall()
+        if not tables:
+            return None
+
+        db_info = {
+            "tables": {},
+            "views": {},
+            "functions": {},
+            "procedures": {},
+        }
+
+        # Table columns: ONE INFORMATION_SCHEMA scan for the whole
+        # database instead of one round-trip per table, grouped back
+        # into per-table lists client-side.
+        table_names = {t[0] for t in tables}
+        col_sql = """
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE,
+                   COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+        cursor.execute(col_sql, (db_name,))
+
+        for table_name, cols in groupby(cursor.fetchall(), key=lambda r: r[0]):
+            # The scan also returns view columns; keep base tables only.
+            if table_name not in table_names:
+                continue
+            db_info["tables"][table_name] = [
+                {
+                    "name": c[1],
+                    "type": c[2],
+                    "nullable": c[3],
+                    "key": c[4],
+                    "default": c[5],
+                    "extra": c[6],
+                }
+                for c in cols
+            ]
+
+        # Views
+        cursor.execute(
+            f"SHOW FULL TABLES FROM `{safe_db}` WHERE Table_type = 'VIEW'"
+        )
+        for v in cursor.fetchall():
+            db_info["views"][v[0]] = {}
+
+        cursor.close()
+        return db_info
+
+    except Error:
+        return None
+    finally:
+        conn.close()
 
 
 # --------------------------------------------------
@@ -122,17 +194,70 @@ def get_table_columns(host, user, passwd, database, table):
 # --------------------------------------------------
 # 4️⃣ Fetch table (SELECT * LIMIT)
 # --------------------------------------------------
-def fetch_table(host, user, passwd, database, table, limit=200):
+def fetch_table(host, user, passwd, database, table, limit=200, offset=0):
     """
-    Return DataFrame and exact SQL used.
+    Return DataFrame and the SQL used (with the page bounds inlined for
+    display). Server-side pagination via LIMIT/OFFSET means only the
+    visible page travels over the wire; the bounds are bound through a
+    prepared statement, so paging through one table re-executes the same
+    parsed plan instead of re-parsing a new literal each time.
     """
     conn = create_connection(host, user, passwd, database)
-    sql = f"SELECT * FROM `{table}` LIMIT {int(limit)};"
-    df = pd.read_sql(sql, conn)
-    conn.close()
+    try:
+        cur = conn.cursor(prepared=True)
+        cur.execute(f"SELECT * FROM `{table}` LIMIT %s OFFSET %s", (int(limit), int(offset)))
+        rows = cur.fetchall()
+        cols = [d[0] for d in cur.description]
+        cur.close()
+    finally:
+        conn.close()
+
+    df = pd.DataFrame.from_records(rows, columns=cols)
+    sql = f"SELECT * FROM `{table}` LIMIT {int(limit)} OFFSET {int(offset)};"
     return df, sql
 
 
+# --------------------------------------------------
+# 4️⃣b Fetch columns + first page in ONE connection
+# --------------------------------------------------
+def get_table_bundle(host, user, passwd, database, table, limit=200, offset=0):
+    """
+    Return (columns, DataFrame, SQL) for a table using a single
+    connection, so column metadata and the first page of data share
+    one TCP+auth handshake instead of two.
+    """
+    sql = f"SELECT * FROM `{table}` LIMIT {int(limit)} OFFSET {int(offset)};"
+
+    with _get_engine(host, user, passwd, database).connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY,
+                       COLUMN_DEFAULT, EXTRA
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = :db AND TABLE_NAME = :tb
+                ORDER BY ORDINAL_POSITION
+                """
+            ),
+            {"db": database, "tb": table},
+        ).fetchall()
+        columns = [
+            {
+                "name": c[0],
+                "type": c[1],
+                "nullable": c[2],
+                "key": c[3],
+                "default": c[4],
+                "extra": c[5],
+            }
+            for c in rows
+        ]
+
+        df = pd.read_sql(sql, conn)
+
+    return columns, df, sql
+
+
 # --------------------------------------------------
 # 5️⃣ Run SELECT safely
 # --------------------------------------------------
@@ -144,10 +269,7 @@ def run_select(host, user, passwd, database, select_sql):
     if not select_sql.strip().lower().startswith("select"):
         raise ValueError("Only SELECT queries are allowed.")
 
-    conn = create_connection(host, user, passwd, database)
-    df = pd.read_sql(select_sql, conn)
-    conn.close()
-    return df
+    return pd.read_sql(select_sql, _get_engine(host, user, passwd, database))
 
 
 # --------------------------------------------------
@@ -175,6 +297,48 @@ def insert_row(host, user, passwd, database, table, data):
     return affected, sql
 
 
+# --------------------------------------------------
+# 6️⃣b Insert many rows in one batch
+# --------------------------------------------------
+# executemany packs the whole chunk into the protocol's multi-row form, so
+# bulk loads pay ~1 round-trip per chunk instead of 1 per row.
+_INSERT_CHUNK = 1000
+
+
+def insert_rows(host, user, passwd, database, table, rows):
+    """
+    Insert many rows (list of dicts sharing the same keys) in batches.
+    Returns (affected_rows, SQL preview).
+    """
+    if not rows:
+        return 0, ""
+
+    cols = list(rows[0].keys())
+    key_set = set(cols)
+    for i, row in enumerate(rows):
+        if set(row.keys()) != key_set:
+            raise ValueError(f"Row {i} does not share the same keys as row 0.")
+
+    placeholders = ", ".join(["%s"] * len(cols))
+    quoted = ", ".join(f"`{c}`" for c in cols)
+    sql = f"INSERT INTO `{table}` ({quoted}) VALUES ({placeholders});"
+    values = [tuple(row[c] for c in cols) for row in rows]
+
+    conn = create_connection(host, user, passwd, database)
+    affected = 0
+    try:
+        cur = conn.cursor()
+        # Chunked so very large loads stay under max_allowed_packet.
+        for start in range(0, len(values), _INSERT_CHUNK):
+            cur.executemany(sql, values[start:start + _INSERT_CHUNK])
+            affected += cur.rowcount
+        cur.close()
+    finally:
+        conn.close()
+
+    return affected, sql
+
+
 # --------------------------------------------------
 # 7️⃣ Delete rows (forced WHERE)
 # --------------------------------------------------